@@ -1,11 +1,31 @@
 #!/usr/bin/python3
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, colorchooser
+import tkinter.font as tkfont
 import json
 import datetime
-from dataclasses import dataclass, asdict
-from typing import List, Optional, Dict, Any
+from dataclasses import dataclass, asdict, field
+from typing import Deque
+from collections import deque
 import os
+import uuid
+
+# Faster JSON libraries are used when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Approximate height of one feature row, used to size quarters that are not rendered
+ROW_HEIGHT_ESTIMATE = 48
+
+# First and last month of each quarter
+_MONTHS = {1: (1, 3), 2: (4, 6), 3: (7, 9), 4: (10, 12)}
 
 @dataclass
 class Feature:
@@ -20,20 +40,17 @@ class Feature:
 class Quarter:
     year: int
     quarter: int
-    features: Optional[List[Feature]] = None
+    features: Deque[Feature] = field(default_factory=deque)
     
     def __post_init__(self):
-        if self.features is None:
-            self.features = []
-    
-    @property
-    def name(self):
-        return f"Q{self.quarter} {self.year}"
-    
-    @property
-    def date_range(self):
-        months = {1: (1, 3), 2: (4, 6), 3: (7, 9), 4: (10, 12)}
-        start_month, end_month = months[self.quarter]
+        # Both ends take O(1) inserts for moves between quarters
+        self.features = deque(self.features)
+        self._reindex()
+        
+        # year and quarter never change, so compute the labels once
+        self.name = f"Q{self.quarter} {self.year}"
+        
+        start_month, end_month = _MONTHS[self.quarter]
         start_date = datetime.date(self.year, start_month, 1)
         if end_month == 12:
             end_date = datetime.date(self.year, end_month, 31)
@@ -41,14 +58,133 @@ class Quarter:
             # Get last day of the month
             next_month = end_month + 1
             end_date = datetime.date(self.year, next_month, 1) - datetime.timedelta(days=1)
-        return f"{start_date.strftime('%b %d')} - {end_date.strftime('%b %d')}"
+        self.date_range = f"{start_date.strftime('%b %d')} - {end_date.strftime('%b %d')}"
+    
+    def _reindex(self):
+        """Rebuild the feature id -> slot map"""
+        # Slots are positions offset by _base, so prepending doesn't shift the others
+        self._base = 0
+        self._index = {feature.id: i for i, feature in enumerate(self.features)}
+    
+    def has_feature(self, feature):
+        """Return whether a feature is in this quarter, without comparing fields"""
+        return feature.id in self._index
+    
+    def index_of(self, feature):
+        """Return the position of a feature in this quarter"""
+        return self._index[feature.id] - self._base
+    
+    def append_feature(self, feature):
+        """Add a feature at the end"""
+        self._index[feature.id] = self._base + len(self.features)
+        self.features.append(feature)
+    
+    def prepend_feature(self, feature):
+        """Add a feature at the beginning"""
+        self._base -= 1
+        self._index[feature.id] = self._base
+        self.features.appendleft(feature)
+    
+    def remove_feature(self, feature):
+        """Remove a feature, in O(1) when it is at either end"""
+        position = self.index_of(feature)
+        del self._index[feature.id]
+        if position == 0:
+            self.features.popleft()
+            self._base += 1
+        elif position == len(self.features) - 1:
+            self.features.pop()
+        else:
+            del self.features[position]
+            self._reindex()
+    
+    def swap_features(self, i, j):
+        """Swap the features at positions i and j"""
+        a, b = self.features[i], self.features[j]
+        self.features[i], self.features[j] = b, a
+        self._index[a.id], self._index[b.id] = self._index[b.id], self._index[a.id]
+
+# Feature titles for each entry in the Templates menu
+_TEMPLATES = {
+    "web": (
+        "Planning & Design",
+        "Backend Setup",
+        "Frontend Development",
+        "Authentication System",
+        "Payment Integration",
+        "Testing & QA",
+        "Deployment"
+    ),
+    "mobile": (
+        "UI/UX Design",
+        "Core Architecture",
+        "User Authentication",
+        "Main Features",
+        "Push Notifications",
+        "App Store Submission",
+        "Marketing Launch"
+    ),
+    "api": (
+        "API Specification",
+        "Database Design",
+        "Authentication & Auth",
+        "Core Endpoints",
+        "Documentation",
+        "Testing Suite",
+        "Monitoring Setup"
+    )
+}
+
+# Colors given to template features, one per quarter
+_TEMPLATE_PALETTE = ("#4CAF50", "#2196F3", "#FF9800", "#9C27B0")
+
+def dump_json(data):
+    """Serialize roadmap data to indented JSON bytes"""
+    if orjson is not None:
+        # orjson serializes dataclasses natively
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, default=asdict).encode('utf-8')
+
+def iter_quarter_data(f):
+    """Yield each quarter dict from a roadmap file opened in binary mode"""
+    if ijson is not None:
+        yield from ijson.items(f, 'quarters.item')
+    else:
+        yield from json.load(f).get('quarters', [])
+
+def destroy_tree(widget):
+    """Destroy a widget and all its descendants with a single Tk call"""
+    # tkinter's destroy() recurses in Python and sends one Tcl destroy per
+    # descendant; Tk tears the subtree down itself, so only the Python side
+    # (child maps and callback commands) is released here
+    widget.tk.call('destroy', widget._w)
+    widget.master.children.pop(widget._name, None)
+    stack = [widget]
+    while stack:
+        w = stack.pop()
+        stack.extend(w.children.values())
+        w.children.clear()
+        tk.Misc.destroy(w)
 
 class QuarterFrame(ttk.Frame):
+    # Bindtag of each feature row control and the method it invokes
+    ROW_ACTIONS = {
+        "FeatureToggle": "toggle_feature",
+        "FeatureStatus": "edit_status",
+        "FeatureEdit": "edit_feature",
+        "FeatureDelete": "delete_feature",
+        "FeatureUp": "move_feature_up",
+        "FeatureDown": "move_feature_down",
+    }
+    
     def __init__(self, parent, quarter: Quarter, app):
         super().__init__(parent, relief=tk.RIDGE, borderwidth=2)
         self.quarter = quarter
         self.app = app
         self.min_width = 250  # Set minimum width
+        # Neighbouring quarters, linked by RoadmapApp
+        self.prev_frame = None
+        self.next_frame = None
         self.setup_ui()
         
     def setup_ui(self):
@@ -72,118 +208,202 @@ class QuarterFrame(ttk.Frame):
         self.features_frame = tk.Frame(self, bg="white")
         self.features_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        self.feature_widgets = []
-        self.refresh_features()
+        self.feature_widgets = {}
+        self._vars = {}
+        self._dirty = set()
+        self._order = []
+        
+        # Rows are built by _ensure_rendered once the quarter scrolls into
+        # view; until then reserve roughly the space they will take
+        self._rendered = False
+        self._reserve_height()
     
     def add_feature(self):
         """Add a new feature to this quarter"""
-        dialog = FeatureDialog(self.app.root, "Add Feature")
+        dialog = FeatureDialog(self.app.root, "Add Feature", screen_size=self.app.screen_size)
         if dialog.result:
             feature = Feature(
-                id=f"feature_{len(self.quarter.features) if self.quarter.features else 0}",
+                id=f"feature_{uuid.uuid4().hex[:8]}",
                 title=dialog.result['title'],
                 description=dialog.result['description'],
                 color=dialog.result.get('color', '#2196F3'),
                 status=dialog.result.get('status', 'Planned')
             )
-            if self.quarter.features is not None:
-                self.quarter.features.append(feature)
-            else:
-                self.quarter.features = [feature]
-            self.refresh_features()
+            self.quarter.append_feature(feature)
+            self._dirty.add(feature.id)
+            self.app._schedule_refresh(self)
             self.app.status_var.set(f"Added feature: {feature.title}")
     
     def refresh_features(self):
         """Refresh the features display"""
-        # Clear existing widgets
-        for widget in self.feature_widgets:
-            widget.destroy()
+        self._dirty.update(feature.id for feature in self.quarter.features)
+        self._apply_dirty()
+    
+    def _ensure_rendered(self):
+        """Build the feature rows if they are not on screen yet"""
+        if self._rendered:
+            return
+        self._rendered = True
+        # Tk ignores a zero size request, so drop the reservation to the 1px
+        # of an empty frame; packed rows then size it through propagation
+        self.features_frame.config(height=1)
+        self.features_frame.pack_propagate(True)
+        self.refresh_features()
+    
+    def _reserve_height(self):
+        """Reserve roughly the height of the rows while they are not rendered"""
+        self.features_frame.pack_propagate(False)
+        # Empty quarters get the 1px of an empty frame, not a blank row
+        self.features_frame.config(height=len(self.quarter.features) * ROW_HEIGHT_ESTIMATE or 1)
+    
+    def _unrender(self):
+        """Destroy the feature rows but keep the header and the current height"""
+        if not self._rendered:
+            return
+        height = self.features_frame.winfo_height()
+        for row in self.feature_widgets.values():
+            row["frame"].destroy()
         self.feature_widgets.clear()
+        self._order = []
+        self._dirty.clear()
+        self.features_frame.pack_propagate(False)
+        self.features_frame.config(height=height)
+        self._rendered = False
+    
+    def _apply_dirty(self):
+        """Bring the feature rows in line with the quarter, touching only dirty rows"""
+        if not self._rendered:
+            # Rebuilt from scratch by _ensure_rendered; keep the reserved
+            # space in step with features moved in or out meanwhile
+            self._dirty.clear()
+            self._reserve_height()
+            return
         
-        # Add feature widgets
-        if self.quarter.features:
-            for feature in self.quarter.features:
-                feature_frame = tk.Frame(self.features_frame, bg="white", relief=tk.RAISED, borderwidth=1)
-                feature_frame.pack(fill=tk.X, pady=2)
-                
-                # Color indicator
-                color_label = tk.Label(feature_frame, width=2, bg=feature.color)
-                color_label.pack(side=tk.LEFT, fill=tk.Y)
-                
-                # Content frame
-                content_frame = tk.Frame(feature_frame, bg="white")
-                content_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5, pady=2)
-                
-                # Checkbox and title
-                title_frame = tk.Frame(content_frame, bg="white")
-                title_frame.pack(fill=tk.X)
-                
-                var = tk.BooleanVar(value=feature.completed)
-                cb = tk.Checkbutton(title_frame, text=feature.title, variable=var,
-                                  command=lambda f=feature, v=var: self.toggle_feature(f, v),
-                                  bg="white", fg="black", font=("Arial", 9, "bold" if not feature.completed else "normal"))
-                cb.pack(side=tk.LEFT)
-                
-                # Status label (clickable to edit)
-                status_color = "green" if feature.completed else "black"
-                status_label = tk.Label(title_frame, text=f" [{feature.status}]", 
-                                      fg=status_color, font=("Arial", 8), cursor="hand2")
-                status_label.pack(side=tk.LEFT, padx=(5, 0))
-                status_label.bind("<Button-1>", lambda e, f=feature: self.edit_status(f))
-                
-                # Description
-                desc_label = tk.Label(content_frame, text=feature.description, 
-                                     bg="white", fg="gray", font=("Arial", 8), 
-                                     anchor="w", justify="left")
-                desc_label.pack(fill=tk.X, padx=(20, 0))
-                
-                # Edit and delete buttons
-                btn_frame = tk.Frame(feature_frame, bg="white")
-                btn_frame.pack(side=tk.RIGHT, padx=2, pady=1)
-                
-                edit_btn = tk.Button(btn_frame, text="Edit", 
-                                   command=lambda f=feature: self.edit_feature(f),
-                                   font=("Arial", 8))
-                edit_btn.pack(side=tk.LEFT)
-                
-                delete_btn = tk.Button(btn_frame, text="Delete", 
-                                     command=lambda f=feature: self.delete_feature(f),
-                                     font=("Arial", 8))
-                delete_btn.pack(side=tk.LEFT)
-                
-                # Move up/down buttons
-                move_frame = tk.Frame(btn_frame, bg="white")
-                move_frame.pack(side=tk.LEFT)
-                
-                up_btn = tk.Button(move_frame, text="↑", 
-                                 command=lambda f=feature: self.move_feature_up(f),
-                                 font=("Arial", 8), width=2)
-                up_btn.pack(side=tk.LEFT)
-                
-                down_btn = tk.Button(move_frame, text="↓", 
-                                   command=lambda f=feature: self.move_feature_down(f),
-                                   font=("Arial", 8), width=2)
-                down_btn.pack(side=tk.LEFT)
-                
-                self.feature_widgets.append(feature_frame)
+        features = self.quarter.features
+        order = [feature.id for feature in features]
+        created = set()
+        
+        # Build missing rows and update the ones marked dirty
+        for feature in features:
+            row = self.feature_widgets.get(feature.id)
+            if row is None:
+                self.feature_widgets[feature.id] = self._build_row(feature)
+                created.add(feature.id)
+            elif feature.id in self._dirty:
+                self._update_row(row, feature)
+        
+        # Destroy rows for features that are no longer in this quarter
+        live = set(order)
+        for feature_id in [fid for fid in self.feature_widgets if fid not in live]:
+            self.feature_widgets.pop(feature_id)["frame"].destroy()
+            self._vars.pop(feature_id, None)
+        
+        # Repack from the first row whose position changed
+        if order != self._order or created:
+            start = 0
+            while (start < len(order) and start < len(self._order)
+                   and order[start] == self._order[start] and order[start] not in created):
+                start += 1
+            for feature_id in order[start:]:
+                self.feature_widgets[feature_id]["frame"].pack_forget()
+            for feature_id in order[start:]:
+                self.feature_widgets[feature_id]["frame"].pack(fill=tk.X, pady=2)
+            self._order = order
+        
+        self._dirty.clear()
     
-    def toggle_feature(self, feature, var):
+    def _build_row(self, feature):
+        """Create the widgets for a single feature row"""
+        # One frame laid out with grid:
+        #   color | checkbox | status | Edit | Delete | ↑ | ↓
+        #   color | description     |
+        feature_frame = tk.Frame(self.features_frame, bg="white", relief=tk.RAISED, borderwidth=1)
+        feature_frame.grid_columnconfigure(2, weight=1)
+        
+        # Color indicator
+        color_label = tk.Label(feature_frame, width=2, bg=feature.color)
+        color_label.grid(row=0, column=0, rowspan=2, sticky="ns")
+        
+        # Checkbox and title
+        # Checkbox variables are kept per feature id and reused across rebuilds
+        var = self._vars.get(feature.id)
+        if var is None:
+            var = self._vars[feature.id] = tk.BooleanVar(self)
+        var.set(feature.completed)
+        cb = tk.Checkbutton(feature_frame, text=feature.title, variable=var,
+                          bg="white", fg="black", font=self.app.title_font(feature))
+        cb.grid(row=0, column=1, sticky="w", padx=(5, 0), pady=(2, 0))
+        
+        # Status label (clickable to edit)
+        status_color = "green" if feature.completed else "black"
+        status_label = tk.Label(feature_frame, text=f" [{feature.status}]", 
+                              fg=status_color, font=self.app.fonts["small"], cursor="hand2")
+        status_label.grid(row=0, column=2, sticky="w", padx=(5, 0), pady=(2, 0))
+        
+        # Description
+        desc_label = tk.Label(feature_frame, text=feature.description, 
+                             bg="white", fg="gray", font=self.app.fonts["small"], 
+                             anchor="w", justify="left")
+        desc_label.grid(row=1, column=1, columnspan=2, sticky="we", padx=(25, 0), pady=(0, 2))
+        
+        # Edit, delete and move up/down buttons
+        edit_btn = tk.Button(feature_frame, text="Edit", font=self.app.fonts["small"])
+        delete_btn = tk.Button(feature_frame, text="Delete", font=self.app.fonts["small"])
+        up_btn = tk.Button(feature_frame, text="↑", font=self.app.fonts["small"], width=2)
+        down_btn = tk.Button(feature_frame, text="↓", font=self.app.fonts["small"], width=2)
+        for column, btn in enumerate((edit_btn, delete_btn, up_btn, down_btn), start=3):
+            btn.grid(row=0, column=column, rowspan=2, pady=1)
+        down_btn.grid_configure(padx=(0, 2))
+        
+        # Actions are dispatched through one class binding per tag (see
+        # RoadmapApp.on_feature_action) instead of a callback per widget
+        for widget, tag in ((cb, "FeatureToggle"), (status_label, "FeatureStatus"),
+                            (edit_btn, "FeatureEdit"), (delete_btn, "FeatureDelete"),
+                            (up_btn, "FeatureUp"), (down_btn, "FeatureDown")):
+            widget.feature = feature
+            widget.quarter_frame = self
+            tags = widget.bindtags()
+            widget.bindtags(tags[:2] + (tag,) + tags[2:])
+        
+        return {"frame": feature_frame, "cb": cb, "var": var, "status": status_label,
+                "desc": desc_label, "color": color_label}
+    
+    def _update_row(self, row, feature):
+        """Update an existing row in place from its feature"""
+        row["cb"].config(text=feature.title, font=self.app.title_font(feature))
+        row["var"].set(feature.completed)
+        row["status"].config(text=f" [{feature.status}]",
+                             fg="green" if feature.completed else "black")
+        row["desc"].config(text=feature.description)
+        row["color"].config(bg=feature.color)
+    
+    def toggle_feature(self, feature):
         """Toggle feature completion"""
-        is_completed = var.get()
+        is_completed = self.feature_widgets[feature.id]["var"].get()
+        if is_completed == feature.completed:
+            # Duplicate event, nothing changed
+            return
         feature.completed = is_completed
         if is_completed:
             feature.status = "Completed"
-        self.refresh_features()
+        self._dirty.add(feature.id)
+        self.app._schedule_refresh(self)
     
     def edit_feature(self, feature):
         """Edit a feature"""
-        dialog = FeatureDialog(self.app.root, "Edit Feature", feature)
+        dialog = FeatureDialog(self.app.root, "Edit Feature", feature, screen_size=self.app.screen_size)
         if dialog.result:
+            if (dialog.result['title'] == feature.title
+                    and dialog.result['description'] == feature.description
+                    and dialog.result.get('color', feature.color) == feature.color
+                    and dialog.result.get('status', feature.status) == feature.status):
+                return
             feature.title = dialog.result['title']
             feature.description = dialog.result['description']
             feature.color = dialog.result.get('color', feature.color)
             feature.status = dialog.result.get('status', feature.status)
-            self.refresh_features()
+            self._dirty.add(feature.id)
+            self.app._schedule_refresh(self)
             self.app.status_var.set(f"Updated feature: {feature.title}")
     
     def edit_status(self, feature):
@@ -195,7 +415,9 @@ class QuarterFrame(ttk.Frame):
         # Create a simple dialog
         dialog = tk.Toplevel(self.app.root)
         dialog.title("Edit Status")
-        dialog.geometry("300x150")
+        # Center the dialog; its size is fixed, so no geometry pass is needed
+        screen_width, screen_height = self.app.screen_size
+        dialog.geometry(f"300x150+{(screen_width - 300) // 2}+{(screen_height - 150) // 2}")
         dialog.transient(self.app.root)
         dialog.grab_set()
         
@@ -208,9 +430,14 @@ class QuarterFrame(ttk.Frame):
                           value=status).pack(pady=2)
         
         def save_status():
+            new_status = status_var.get()
+            if new_status == feature.status and feature.completed == (new_status == "Completed"):
+                dialog.destroy()
+                return
             feature.status = status_var.get()
             feature.completed = (feature.status == "Completed")
-            self.refresh_features()
+            self._dirty.add(feature.id)
+            self.app._schedule_refresh(self)
             self.app.status_var.set(f"Updated status to: {feature.status}")
             dialog.destroy()
         
@@ -223,34 +450,31 @@ class QuarterFrame(ttk.Frame):
         tk.Button(button_frame, text="OK", command=save_status).pack(side=tk.LEFT, padx=5)
         tk.Button(button_frame, text="Cancel", command=cancel).pack(side=tk.LEFT, padx=5)
         
-        # Center the dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - (dialog.winfo_width() // 2)
-        y = (dialog.winfo_screenheight() // 2) - (dialog.winfo_height() // 2)
-        dialog.geometry(f"+{x}+{y}")
-        
         dialog.wait_window()
     
     def delete_feature(self, feature):
         """Delete a feature"""
         if messagebox.askyesno("Delete Feature", f"Delete '{feature.title}'?"):
-            if self.quarter.features and feature in self.quarter.features:
-                self.quarter.features.remove(feature)
-            self.refresh_features()
+            if self.quarter.has_feature(feature):
+                self.quarter.remove_feature(feature)
+            self.app._schedule_refresh(self)
             self.app.status_var.set(f"Deleted feature: {feature.title}")
     
     def move_feature_up(self, feature):
         """Move feature up within quarter or to previous quarter"""
-        if not self.quarter.features:
+        if not self.quarter.has_feature(feature):
             return
         
-        current_index = self.quarter.features.index(feature)
+        current_index = self.quarter.index_of(feature)
+        
+        if current_index == 0 and self.prev_frame is None:
+            # Already first in the first quarter
+            return
         
         if current_index > 0:
             # Move up within same quarter
-            self.quarter.features[current_index], self.quarter.features[current_index - 1] = \
-                self.quarter.features[current_index - 1], self.quarter.features[current_index]
-            self.refresh_features()
+            self.quarter.swap_features(current_index, current_index - 1)
+            self.app._schedule_refresh(self)
             self.app.status_var.set(f"Moved '{feature.title}' up")
         else:
             # Move to previous quarter
@@ -258,16 +482,20 @@ class QuarterFrame(ttk.Frame):
     
     def move_feature_down(self, feature):
         """Move feature down within quarter or to next quarter"""
-        if not self.quarter.features:
+        if not self.quarter.has_feature(feature):
             return
         
-        current_index = self.quarter.features.index(feature)
+        current_index = self.quarter.index_of(feature)
+        last_index = len(self.quarter.features) - 1
+        
+        if current_index == last_index and self.next_frame is None:
+            # Already last in the last quarter
+            return
         
-        if current_index < len(self.quarter.features) - 1:
+        if current_index < last_index:
             # Move down within same quarter
-            self.quarter.features[current_index], self.quarter.features[current_index + 1] = \
-                self.quarter.features[current_index + 1], self.quarter.features[current_index]
-            self.refresh_features()
+            self.quarter.swap_features(current_index, current_index + 1)
+            self.app._schedule_refresh(self)
             self.app.status_var.set(f"Moved '{feature.title}' down")
         else:
             # Move to next quarter
@@ -275,62 +503,57 @@ class QuarterFrame(ttk.Frame):
     
     def move_to_previous_quarter(self, feature):
         """Move feature to previous quarter"""
-        current_quarter_index = self.app.quarters.index(self.quarter)
+        previous_frame = self.prev_frame
         
-        if current_quarter_index > 0:
-            previous_quarter = self.app.quarters[current_quarter_index - 1]
+        if previous_frame is not None:
+            previous_quarter = previous_frame.quarter
             
             # Remove from current quarter
-            if self.quarter.features:
-                self.quarter.features.remove(feature)
+            if self.quarter.has_feature(feature):
+                self.quarter.remove_feature(feature)
             
             # Add to previous quarter (at the end)
-            if previous_quarter.features is not None:
-                previous_quarter.features.append(feature)
-            else:
-                previous_quarter.features = [feature]
+            previous_quarter.append_feature(feature)
             
             # Refresh both quarters
-            self.refresh_features()
-            previous_key = f"{previous_quarter.year}_{previous_quarter.quarter}"
-            if previous_key in self.app.quarter_frames:
-                self.app.quarter_frames[previous_key].refresh_features()
+            self.app._schedule_refresh(self)
+            self.app._schedule_refresh(previous_frame)
             
             self.app.status_var.set(f"Moved '{feature.title}' to {previous_quarter.name}")
     
     def move_to_next_quarter(self, feature):
         """Move feature to next quarter"""
-        current_quarter_index = self.app.quarters.index(self.quarter)
+        next_frame = self.next_frame
         
-        if current_quarter_index < len(self.app.quarters) - 1:
-            next_quarter = self.app.quarters[current_quarter_index + 1]
+        if next_frame is not None:
+            next_quarter = next_frame.quarter
             
             # Remove from current quarter
-            if self.quarter.features:
-                self.quarter.features.remove(feature)
+            if self.quarter.has_feature(feature):
+                self.quarter.remove_feature(feature)
             
             # Add to next quarter (at the beginning)
-            if next_quarter.features is not None:
-                next_quarter.features.insert(0, feature)
-            else:
-                next_quarter.features = [feature]
+            next_quarter.prepend_feature(feature)
             
             # Refresh both quarters
-            self.refresh_features()
-            next_key = f"{next_quarter.year}_{next_quarter.quarter}"
-            if next_key in self.app.quarter_frames:
-                self.app.quarter_frames[next_key].refresh_features()
+            self.app._schedule_refresh(self)
+            self.app._schedule_refresh(next_frame)
             
             self.app.status_var.set(f"Moved '{feature.title}' to {next_quarter.name}")
 
 
 class FeatureDialog:
-    def __init__(self, parent, title, feature=None):
+    def __init__(self, parent, title, feature=None, screen_size=None):
         self.result = None
         
         self.dialog = tk.Toplevel(parent)
         self.dialog.title(title)
-        self.dialog.geometry("750x750")
+        
+        # Center the dialog; its size is fixed, so no geometry pass is needed
+        if screen_size is None:
+            screen_size = (self.dialog.winfo_screenwidth(), self.dialog.winfo_screenheight())
+        screen_width, screen_height = screen_size
+        self.dialog.geometry(f"750x750+{(screen_width - 750) // 2}+{(screen_height - 750) // 2}")
         self.dialog.transient(parent)
         self.dialog.grab_set()
         
@@ -384,12 +607,6 @@ class FeatureDialog:
         tk.Button(button_frame, text="OK", command=self.ok_clicked).pack(side=tk.LEFT, padx=5)
         tk.Button(button_frame, text="Cancel", command=self.cancel_clicked).pack(side=tk.LEFT, padx=5)
         
-        # Center the dialog
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (self.dialog.winfo_width() // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (self.dialog.winfo_height() // 2)
-        self.dialog.geometry(f"+{x}+{y}")
-        
         self.dialog.wait_window()
     
     def choose_color(self):
@@ -428,15 +645,32 @@ class RoadmapApp:
         self.root = root
         self.root.title("AllRoads v0.0.2")
         self.root.geometry("1200x700")
+        self.screen_size = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
         
         self.quarters = []
         self.quarter_frames = {}
+        # id(quarter) -> position in self.quarters, rebuilt lazily when stale
+        self.quarter_pos = {}
+        self._pos_dirty = True
+        self._last_frame = None
         self.current_file = None
+        self._refresh_pending = set()
+        self._refresh_job = None
+        self._last_canvas_w = None
+        self._wheel_accum = 0
+        self._wheel_pending = None
         
         self.setup_ui()
         self.initialize_quarters()
     
     def setup_ui(self):
+        # Fonts shared by every feature row
+        self.fonts = {
+            "title_bold": tkfont.Font(family="Arial", size=9, weight="bold"),
+            "title_normal": tkfont.Font(family="Arial", size=9, weight="normal"),
+            "small": tkfont.Font(family="Arial", size=8),
+        }
+        
         # Menu bar
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
@@ -477,7 +711,7 @@ class RoadmapApp:
         
         # Canvas and scrollbars
         self.canvas = tk.Canvas(canvas_frame, bg="#f0f0f0")
-        v_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=self.canvas.yview)
+        v_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=self.on_scrollbar)
         
         self.canvas.configure(yscrollcommand=v_scrollbar.set)
         
@@ -486,20 +720,60 @@ class RoadmapApp:
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         # Frame to hold quarters
-        self.quarters_container = ttk.Frame(self.canvas)
-        self.canvas_window = self.canvas.create_window((0, 0), window=self.quarters_container, anchor="nw")
+        self.create_quarters_container()
         
         # Configure scrolling
-        self.quarters_container.bind("<Configure>", self.on_frame_configure)
         self.canvas.bind("<Configure>", self.on_canvas_configure)
         self.canvas.bind("<MouseWheel>", self.on_mousewheel)
         
+        # Feature row controls
+        for tag, action in QuarterFrame.ROW_ACTIONS.items():
+            handler = lambda e, a=action: self.on_feature_action(e, a)
+            self.root.bind_class(tag, "<ButtonRelease-1>", handler)
+            self.root.bind_class(tag, "<Key-space>", handler)
+        
         # Status bar
         self.status_var = tk.StringVar()
         self.status_var.set("Ready")
         status_bar = ttk.Label(self.root, textvariable=self.status_var, relief=tk.SUNKEN)
         status_bar.pack(side=tk.BOTTOM, fill=tk.X)
     
+    def _schedule_refresh(self, quarter_frame):
+        """Queue a quarter frame to be refreshed once the event loop is idle"""
+        self._refresh_pending.add(quarter_frame)
+        if self._refresh_job is None:
+            self._refresh_job = self.root.after_idle(self._flush_refreshes)
+    
+    def _flush_refreshes(self):
+        """Refresh every quarter frame queued since the last idle pass"""
+        pending = self._refresh_pending
+        self._refresh_pending = set()
+        self._refresh_job = None
+        for quarter_frame in pending:
+            if quarter_frame.winfo_exists():
+                quarter_frame._apply_dirty()
+    
+    def create_quarters_container(self):
+        """Create the frame inside the canvas that holds the quarter frames"""
+        self.quarters_container = ttk.Frame(self.canvas)
+        self.canvas_window = self.canvas.create_window((0, 0), window=self.quarters_container, anchor="nw")
+        if self._last_canvas_w is not None:
+            self.canvas.itemconfig(self.canvas_window, width=self._last_canvas_w)
+        self.quarters_container.bind("<Configure>", self.on_frame_configure)
+    
+    def title_font(self, feature):
+        """Return the font for a feature title, bold until it is completed"""
+        return self.fonts["title_normal" if feature.completed else "title_bold"]
+    
+    def on_feature_action(self, event, action):
+        """Run a feature row action on the feature stored on the widget"""
+        widget = event.widget
+        if event.type == tk.EventType.ButtonRelease:
+            # Like a button, ignore releases outside the widget
+            if not (0 <= event.x < widget.winfo_width() and 0 <= event.y < widget.winfo_height()):
+                return
+        getattr(widget.quarter_frame, action)(widget.feature)
+    
     def on_frame_configure(self, event):
         """Reset the scroll region to encompass the inner frame"""
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
@@ -507,11 +781,49 @@ class RoadmapApp:
     def on_canvas_configure(self, event):
         """Adjust inner frame width to canvas width"""
         canvas_width = event.width
-        self.canvas.itemconfig(self.canvas_window, width=canvas_width)
+        # Height-only changes don't need the inner frame re-measured
+        if canvas_width != self._last_canvas_w:
+            self._last_canvas_w = canvas_width
+            self.canvas.itemconfig(self.canvas_window, width=canvas_width)
+        self._update_visible()
+    
+    def on_scrollbar(self, *args):
+        """Scroll the canvas from the scrollbar"""
+        self.canvas.yview(*args)
+        self._update_visible()
     
     def on_mousewheel(self, event):
         """Handle mouse wheel scrolling"""
-        self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        # Wheel ticks are accumulated and applied in one scroll when idle
+        self._wheel_accum += event.delta
+        if self._wheel_pending is None:
+            self._wheel_pending = self.root.after_idle(self._flush_wheel)
+    
+    def _flush_wheel(self):
+        """Scroll by the wheel movement accumulated since the last idle pass"""
+        units = int(-self._wheel_accum / 120)
+        # Keep the movement below one unit for the next flush
+        self._wheel_accum += units * 120
+        if units:
+            self.canvas.yview_scroll(units, "units")
+            self._update_visible()
+        self._wheel_pending = None
+    
+    def _update_visible(self):
+        """Render quarters near the viewport and unrender the ones far from it"""
+        view_height = self.canvas.winfo_height()
+        top = self.canvas.canvasy(0) - view_height
+        bottom = self.canvas.canvasy(0) + 2 * view_height
+        # Walk the frame chain rather than quarter_frames, which holds only
+        # one frame per (year, quarter) when a file repeats a quarter
+        quarter_frame = self._last_frame
+        while quarter_frame is not None:
+            y = quarter_frame.winfo_y()
+            if y + quarter_frame.winfo_height() >= top and y <= bottom:
+                quarter_frame._ensure_rendered()
+            else:
+                quarter_frame._unrender()
+            quarter_frame = quarter_frame.prev_frame
     
     def initialize_quarters(self):
         """Initialize with current year quarters"""
@@ -525,7 +837,8 @@ class RoadmapApp:
             if q > 4:
                 q -= 4
                 year += 1
-            self.add_quarter_to_ui(Quarter(year, q))
+            self.add_quarter_to_ui(Quarter(year, q), defer_layout=True)
+        self.update_layout()
     
     def add_quarter(self):
         """Add a new quarter"""
@@ -541,48 +854,93 @@ class RoadmapApp:
                 year = last_quarter.year
                 quarter = last_quarter.quarter + 1
         
-        self.add_quarter_to_ui(Quarter(year, quarter))
-        self.status_var.set(f"Added {Quarter(year, quarter).name}")
+        new_quarter = Quarter(year, quarter)
+        self.add_quarter_to_ui(new_quarter)
+        self.status_var.set(f"Added {new_quarter.name}")
     
-    def add_quarter_to_ui(self, quarter: Quarter):
-        """Add a quarter to the UI"""
+    def add_quarter_to_ui(self, quarter: Quarter, defer_layout=False):
+        """Add a quarter to the UI (batch callers pass defer_layout and call update_layout once)"""
         self.quarters.append(quarter)
+        self._pos_dirty = True
         
-        # Create frame for this quarter with minimum width
+        # Create frame for this quarter; its width follows the canvas
         quarter_frame = QuarterFrame(self.quarters_container, quarter, self)
         quarter_frame.pack(fill=tk.BOTH, padx=5, pady=5)
-        quarter_frame.config(width=400)  # Set minimum width
         
-        self.quarter_frames[f"{quarter.year}_{quarter.quarter}"] = quarter_frame
+        # Link it after the current last quarter
+        if self._last_frame is not None:
+            self._last_frame.next_frame = quarter_frame
+            quarter_frame.prev_frame = self._last_frame
+        self._last_frame = quarter_frame
         
-        # Update scroll region after adding
+        self.quarter_frames[(quarter.year, quarter.quarter)] = quarter_frame
+        
+        if not defer_layout:
+            self.update_layout()
+    
+    def add_quarters_bulk(self, quarters):
+        """Add several quarters to the UI with a single layout pass"""
+        for quarter in quarters:
+            self.add_quarter_to_ui(quarter, defer_layout=True)
+        self.update_layout()
+    
+    def update_layout(self):
+        """Update the scroll region and visible quarters after adding quarters"""
         self.canvas.update_idletasks()
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self._update_visible()
+    
+    def _ensure_positions(self):
+        """Rebuild quarter_pos if quarters changed since it was last built"""
+        if self._pos_dirty:
+            self.quarter_pos = {id(q): i for i, q in enumerate(self.quarters)}
+            self._pos_dirty = False
+    
+    def quarter_position(self, quarter):
+        """Return the position of a quarter in the roadmap"""
+        # Hot paths should follow QuarterFrame.prev_frame/next_frame instead
+        self._ensure_positions()
+        return self.quarter_pos[id(quarter)]
     
     def remove_quarter(self):
         """Remove the last quarter"""
         if self.quarters:
             last_quarter = self.quarters.pop()
-            key = f"{last_quarter.year}_{last_quarter.quarter}"
-            if key in self.quarter_frames:
-                self.quarter_frames[key].destroy()
-                del self.quarter_frames[key]
+            self._pos_dirty = True
+            frame = self._last_frame
+            if frame is not None:
+                self._last_frame = frame.prev_frame
+                if self._last_frame is not None:
+                    self._last_frame.next_frame = None
+                frame.destroy()
+                # A repeated quarter may have replaced this frame's entry
+                key = (last_quarter.year, last_quarter.quarter)
+                if self.quarter_frames.get(key) is frame:
+                    del self.quarter_frames[key]
             self.status_var.set(f"Removed {last_quarter.name}")
     
     def clear_all(self):
-        """Clear all quarters and features"""
+        """Clear all quarters and features, returning whether anything was cleared"""
         if messagebox.askyesno("Clear All", "This will remove all quarters and features. Continue?"):
-            for quarter_frame in self.quarter_frames.values():
-                quarter_frame.destroy()
+            # Destroying the container tears down every quarter in one call
+            destroy_tree(self.quarters_container)
+            self.canvas.delete(self.canvas_window)
+            self.create_quarters_container()
+            self.canvas.configure(scrollregion=(0, 0, 0, 0))
             self.quarter_frames.clear()
             self.quarters.clear()
+            self._pos_dirty = True
+            self._last_frame = None
             self.status_var.set("Cleared all quarters")
+            return True
+        return False
     
     def new_roadmap(self):
         """Create a new roadmap"""
         if self.quarters:
             if messagebox.askyesno("New Roadmap", "Clear current roadmap and start new?"):
-                self.clear_all()
+                if not self.clear_all():
+                    return
                 self.initialize_quarters()
                 self.current_file = None
                 self.status_var.set("New roadmap created")
@@ -598,36 +956,41 @@ class RoadmapApp:
         )
         if filename:
             try:
-                with open(filename, 'r') as f:
-                    data = json.load(f)
+                # Quarters are built as each one is parsed, so the whole
+                # file never sits in memory as nested dicts
+                quarters = []
+                seen_ids = set()
+                with open(filename, 'rb') as f:
+                    for quarter_data in iter_quarter_data(f):
+                        quarter = Quarter(
+                            year=quarter_data['year'],
+                            quarter=quarter_data['quarter']
+                        )
+                        
+                        # Load features
+                        for feature_data in quarter_data.get('features', []):
+                            feature = Feature(
+                                id=feature_data['id'],
+                                title=feature_data['title'],
+                                description=feature_data['description'],
+                                completed=feature_data.get('completed', False),
+                                status=feature_data.get('status', 'Planned'),
+                                color=feature_data.get('color', '#2196F3')
+                            )
+                            # Older files could reuse ids; rows are keyed by id
+                            if feature.id in seen_ids:
+                                feature.id = f"feature_{uuid.uuid4().hex[:8]}"
+                            seen_ids.add(feature.id)
+                            quarter.append_feature(feature)
+                        
+                        quarters.append(quarter)
                 
                 # Clear existing
-                self.clear_all()
-                self.quarters.clear()
+                if not self.clear_all():
+                    return
                 
                 # Load quarters
-                for quarter_data in data.get('quarters', []):
-                    quarter = Quarter(
-                        year=quarter_data['year'],
-                        quarter=quarter_data['quarter']
-                    )
-                    
-                    # Load features
-                    for feature_data in quarter_data.get('features', []):
-                        feature = Feature(
-                            id=feature_data['id'],
-                            title=feature_data['title'],
-                            description=feature_data['description'],
-                            completed=feature_data.get('completed', False),
-                            status=feature_data.get('status', 'Planned'),
-                            color=feature_data.get('color', '#2196F3')
-                        )
-                        if quarter.features is not None:
-                            quarter.features.append(feature)
-                        else:
-                            quarter.features = [feature]
-                    
-                    self.add_quarter_to_ui(quarter)
+                self.add_quarters_bulk(quarters)
                 
                 self.current_file = filename
                 self.status_var.set(f"Opened: {os.path.basename(filename)}")
@@ -655,21 +1018,12 @@ class RoadmapApp:
         """Save roadmap to specific file"""
         try:
             data = {
+                # Features are dataclasses, serialized field by field by dump_json
                 'quarters': [
                     {
                         'year': quarter.year,
                         'quarter': quarter.quarter,
-                        'features': [
-                            {
-                                'id': feature.id,
-                                'title': feature.title,
-                                'description': feature.description,
-                                'completed': feature.completed,
-                                'status': feature.status,
-                                'color': feature.color
-                            }
-                            for feature in quarter.features
-                        ]
+                        'features': list(quarter.features)
                     }
                     for quarter in self.quarters
                 ],
@@ -677,8 +1031,8 @@ class RoadmapApp:
                 'version': '2.0'
             }
             
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(filename, 'wb') as f:
+                f.write(dump_json(data))
             
             self.current_file = filename
             self.status_var.set(f"Saved: {os.path.basename(filename)}")
@@ -687,53 +1041,28 @@ class RoadmapApp:
     
     def load_template(self, template_type):
         """Load a predefined template"""
-        templates = {
-            "web": [
-                "Planning & Design",
-                "Backend Setup", 
-                "Frontend Development",
-                "Authentication System",
-                "Payment Integration",
-                "Testing & QA",
-                "Deployment"
-            ],
-            "mobile": [
-                "UI/UX Design",
-                "Core Architecture",
-                "User Authentication",
-                "Main Features",
-                "Push Notifications",
-                "App Store Submission",
-                "Marketing Launch"
-            ],
-            "api": [
-                "API Specification",
-                "Database Design",
-                "Authentication & Auth",
-                "Core Endpoints",
-                "Documentation",
-                "Testing Suite",
-                "Monitoring Setup"
-            ]
-        }
-        
-        if template_type in templates:
+        if template_type in _TEMPLATES:
             if self.quarters:
                 if not messagebox.askyesno("Load Template", "This will replace current roadmap. Continue?"):
                     return
             
             # Clear and recreate quarters
-            self.clear_all()
+            if not self.clear_all():
+                return
             current_year = datetime.datetime.now().year
             
             # Distribute features across quarters
-            features = templates[template_type]
+            features = _TEMPLATES[template_type]
             features_per_quarter = 2
             
-            num_quarters = (len(features) + features_per_quarter - 1) // features_per_quarter
+            num_quarters, remainder = divmod(len(features), features_per_quarter)
+            if remainder:
+                num_quarters += 1
             
+            quarters = []
             for i in range(num_quarters):
                 quarter = Quarter(current_year, i + 1)
+                color = _TEMPLATE_PALETTE[i % len(_TEMPLATE_PALETTE)]
                 
                 # Add features to this quarter
                 start_idx = i * features_per_quarter
@@ -745,15 +1074,13 @@ class RoadmapApp:
                         title=feature_title,
                         description=f"Implementation of {feature_title}",
                         status="Planned",
-                        color=["#4CAF50", "#2196F3", "#FF9800", "#9C27B0"][i % 4]
+                        color=color
                     )
-                    if quarter.features is not None:
-                        quarter.features.append(feature)
-                    else:
-                        quarter.features = [feature]
+                    quarter.append_feature(feature)
                 
-                self.add_quarter_to_ui(quarter)
+                quarters.append(quarter)
             
+            self.add_quarters_bulk(quarters)
             self.status_var.set(f"Loaded {template_type} template")
 
 def main():